@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import simpledialog
 from tkinter import ttk, messagebox
-import random
 import datetime
 import urllib.request
 import numpy as np
@@ -10,6 +9,145 @@ import json
 import os
 from typing import Dict, List, Tuple, Optional
 import time
+import threading
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; iterate_once falls back to NumPy without it
+    njit = None
+
+DIRECTION_INDEX = {'left': 0, 'right': 1, 'up': 2, 'down': 3}
+# np.roll (shift, axis) that brings the checked neighbor of each pixel onto it, per direction index
+NEIGHBOR_SHIFTS = [(1, 1), (-1, 1), (1, 0), (-1, 0)]
+
+# Side of the square tiles the compiled kernel works on, and how many iterations
+# it advances each tile (inside a halo of that many pixels) before moving on
+TILE_SIZE = 64
+TEMPORAL_STEPS = 4
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _update_pixel(labels, x, y, x_up, x_down, y_left, y_right, dir_arr, activ_lut):
+        """Next color index of one pixel, same rules as ADISFile._step_numpy"""
+        current = labels[x, y]
+        # Later directions win, and within a direction being swapped into beats swapping out,
+        # so scan in reverse and stop at the first swap that applies
+        for direction in range(3, -1, -1):
+            # (n_x, n_y) is checked in this direction, (q_x, q_y) checks this pixel
+            if direction == 0:
+                n_x, n_y, q_x, q_y = x, y_left, x, y_right
+            elif direction == 1:
+                n_x, n_y, q_x, q_y = x, y_right, x, y_left
+            elif direction == 2:
+                n_x, n_y, q_x, q_y = x_up, y, x_down, y
+            else:
+                n_x, n_y, q_x, q_y = x_down, y, x_up, y
+            checker = labels[q_x, q_y]
+            if dir_arr[checker] == direction and activ_lut[checker, current]:
+                return checker
+            neighbor = labels[n_x, n_y]
+            if dir_arr[current] == direction and activ_lut[current, neighbor]:
+                return neighbor
+        return current
+
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _step(padded, new_labels, dir_arr, activ_lut, steps):
+        """Advance the grid by steps iterations, one cache-sized tile at a time
+
+        padded is the grid with a wrapped halo of at least steps pixels, see _wrap_pad.
+        """
+        R = new_labels.shape[0]
+        halo = (padded.shape[0] - R) // 2
+        tile = min(TILE_SIZE, R)
+        tiles_per_side = (R + tile - 1) // tile
+        for t in prange(tiles_per_side * tiles_per_side):
+            bx = (t // tiles_per_side) * tile
+            by = (t % tiles_per_side) * tile
+            height = min(tile, R - bx)
+            width = min(tile, R - by)
+
+            # Copy the tile plus enough of the halo for every step
+            size_x = height + 2 * steps
+            size_y = width + 2 * steps
+            x0 = halo - steps + bx
+            y0 = halo - steps + by
+            src = padded[x0:x0 + size_x, y0:y0 + size_y].copy()
+            dst = np.empty_like(src)
+
+            # Each step leaves one more ring of the halo out of date
+            for s in range(1, steps + 1):
+                for i in range(s, size_x - s):
+                    for j in range(s, size_y - s):
+                        dst[i, j] = _update_pixel(src, i, j, i - 1, i + 1, j - 1, j + 1, dir_arr, activ_lut)
+                src, dst = dst, src
+
+            for i in range(height):
+                for j in range(width):
+                    new_labels[bx + i, by + j] = src[steps + i, steps + j]
+else:
+    _step = None
+
+def _wrap_pad(labels: np.ndarray, padded: np.ndarray) -> None:
+    """Copy labels into the middle of padded, surrounded by a toroidally wrapped halo
+
+    The halo is (padded side - labels side) // 2 pixels wide and at most the labels side.
+    """
+    R = labels.shape[0]
+    h = (padded.shape[0] - R) // 2
+    padded[h:h + R, h:h + R] = labels
+    padded[:h, h:h + R] = labels[R - h:]
+    padded[h + R:, h:h + R] = labels[:h]
+    # Columns are copied from the filled rows, which also fills the corners
+    padded[:, :h] = padded[:, R:R + h]
+    padded[:, h + R:] = padded[:, h:2 * h]
+
+# Grids whose side is a multiple of this are stepped on packed bit-planes without Numba
+BITPLANE_WORD = 64
+
+def _pack_planes(labels: np.ndarray, bits: int) -> np.ndarray:
+    """Split a color grid into bit-planes of 64 pixels per uint64 word, shape (bits, R, R // 64)"""
+    planes = [np.packbits((labels >> b) & 1, axis=1, bitorder='little') for b in range(bits)]
+    return np.stack(planes).view('<u8')
+
+def _unpack_planes(planes: np.ndarray, labels: np.ndarray) -> None:
+    """Reassemble a color grid from its bit-planes into labels"""
+    labels[...] = 0
+    for b in range(planes.shape[0]):
+        labels |= np.unpackbits(planes[b].view(np.uint8), axis=1, bitorder='little').astype(labels.dtype) << b
+
+def _roll_words(words: np.ndarray, shift: int, axis: int) -> np.ndarray:
+    """np.roll of the packed pixel grid by one pixel, axis 0 being rows and 1 columns"""
+    if axis == 0:
+        return np.roll(words, shift, axis=-2)
+    # Column k of a word is bit k, so carry the edge bit over from the neighboring word
+    if shift == 1:
+        return (words << np.uint64(1)) | (np.roll(words, 1, axis=-1) >> np.uint64(63))
+    return (words >> np.uint64(1)) | (np.roll(words, -1, axis=-1) << np.uint64(63))
+
+def _run_lengths(bits: np.ndarray, max_run: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Run-length encode a 0/1 array into (symbols, lengths) with no length above max_run
+
+    Longer runs are split into consecutive runs of the same symbol, e.g. 300 ones
+    with max_run 127 become (1, 127), (1, 127), (1, 46).
+    """
+    changes = np.flatnonzero(np.diff(bits)) + 1
+    starts = np.r_[0, changes]
+    ends = np.r_[changes, bits.size]
+    lengths = ends - starts
+    syms = bits[starts]
+    
+    # Run i becomes pieces[i] chunks, all full except the last
+    pieces = (lengths + max_run - 1) // max_run
+    run = np.repeat(np.arange(lengths.size), pieces)
+    k = np.arange(run.size) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    is_last = k == pieces[run] - 1
+    out_lengths = np.where(is_last, lengths[run] - max_run * (pieces[run] - 1), max_run)
+    return syms[run], out_lengths
+
+def _pack_rgb(rgb: np.ndarray) -> np.ndarray:
+    """Pack the trailing RGB axis of a uint8 array into single (r << 16) | (g << 8) | b ints"""
+    rgb = rgb.astype(np.int32)
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
 
 class Color:
     def __init__(self, rgb: Tuple[int, int, int], check_direction: str, activation_colors: List[Tuple[int, int, int]]):
@@ -18,6 +156,9 @@ class Color:
         self.activation_colors = activation_colors
 
 class ADISFile:
+    _net_offset_minutes = 0  # internet time minus local time, in minutes
+    _time_sync_started = False
+    
     def __init__(self, resolution: int, color_depth: int, iteration_speed: int,
                  last_time: int = 0, now_time: int = 0, iteration_count: int = 0):
         self.resolution = resolution
@@ -27,87 +168,188 @@ class ADISFile:
         self.now_time = now_time
         self.iteration_count = iteration_count
         self.color_set: List[Color] = []
-        self.image_array = np.zeros((resolution, resolution, 3), dtype=np.uint8)
+        self.labels = np.zeros((resolution, resolution), dtype=np.uint8)  # color_set index per pixel
+        self._spare_labels = np.empty_like(self.labels)  # iterate writes here, then swaps with labels
+        halo = min(TEMPORAL_STEPS, resolution)
+        self._padded_labels = np.empty((resolution + 2 * halo, resolution + 2 * halo), dtype=np.uint8)
         self.encrypted_string: Optional[str] = None
         self.key_image: Optional[np.ndarray] = None
+        self._key_cache: Optional[bytes] = None  # cleared whenever labels change
+        self.palette = np.zeros((0, 3), dtype=np.uint8)
+        self._rgb_out = np.empty((resolution, resolution, 3), dtype=np.uint8)  # reused by image_array
+        self.rgb_to_idx: Dict[Tuple[int, int, int], int] = {}
+        self.rgb_keys = np.zeros(0, dtype=np.int32)  # packed RGB of each color_set entry
+        self.dir_arr = np.zeros(0, dtype=np.int8)
+        self.activ_idx_sets: List[set] = []
+        self.activ_lut = np.zeros((0, 0), dtype=bool)
         
     def generate_random_colors(self) -> None:
         """Generate random unique colors for the color set"""
-        used_colors = set()
-        directions = ['left', 'right', 'up', 'down']
+        depth = self.color_depth
+        directions = list(DIRECTION_INDEX)
         
-        for _ in range(self.color_depth):
-            # Generate unique RGB color
-            while True:
-                rgb = (random.randint(0, 255), 
-                      random.randint(0, 255),
-                      random.randint(0, 255))
-                if rgb not in used_colors:
-                    used_colors.add(rgb)
-                    break
-            # Generate activation colors
-            available_colors = list(used_colors - {rgb})
-            if len(available_colors) >= 1:
-                num_activation_colors = random.randint(1, min(2, len(available_colors)))
-                activation_colors = random.sample(available_colors, num_activation_colors)
-            else:
-                activation_colors = []
+        # Generate unique RGB colors, redrawing the rare duplicates
+        ids = np.unique(np.random.randint(0, 256 ** 3, size=depth))
+        while ids.size < depth:
+            ids = np.unique(np.r_[ids, np.random.randint(0, 256 ** 3, size=depth - ids.size)])
+        rgbs = np.stack([(ids >> 16) & 0xFF, (ids >> 8) & 0xFF, ids & 0xFF], axis=1).astype(np.uint8)
+        
+        # Generate one or two distinct activation colors among the other colors
+        others = depth - 1
+        counts = np.random.randint(1, min(2, others) + 1, size=depth) if others else np.zeros(depth, dtype=int)
+        first = np.random.randint(0, max(others, 1), size=depth)
+        second = (first + np.random.randint(1, others, size=depth)) % others if others > 1 else first.copy()
+        own = np.arange(depth)
+        first += first >= own  # skip the color itself
+        second += second >= own
+        
+        # Assign random check directions
+        check_directions = np.random.randint(0, len(directions), size=depth)
+        
+        rgb_list = [tuple(rgb) for rgb in rgbs.tolist()]
+        for i, (count, a, b, d) in enumerate(zip(counts.tolist(), first.tolist(), second.tolist(),
+                                                 check_directions.tolist())):
+            activation_colors = [rgb_list[k] for k in (a, b)[:count]]
+            self.color_set.append(Color(rgb_list[i], directions[d], activation_colors))
 
-            # Assign random check direction
-            check_direction = random.choice(directions)
-            
-            self.color_set.append(Color(rgb, check_direction, activation_colors))
+        self.build_color_tables()
+
+    def build_color_tables(self) -> None:
+        """Build array lookup tables from the color set"""
+        self.palette = np.array([c.rgb for c in self.color_set], dtype=np.uint8)
+        self.rgb_to_idx = {c.rgb: i for i, c in enumerate(self.color_set)}
+        self.rgb_keys = _pack_rgb(self.palette)
+        self.dir_arr = np.array([DIRECTION_INDEX[c.check_direction] for c in self.color_set], dtype=np.int8)
+        self.activ_idx_sets = [set(self.rgb_to_idx[ac] for ac in c.activation_colors) for c in self.color_set]
+        # activ_lut[i, j] is True when color j activates a swap for color i
+        self.activ_lut = np.zeros((len(self.color_set), len(self.color_set)), dtype=bool)
+        for i, activ in enumerate(self.activ_idx_sets):
+            self.activ_lut[i, list(activ)] = True
 
     def initialize_image(self) -> None:
         """Fill image with random colors from color set"""
-        for i in range(self.resolution):
-            for j in range(self.resolution):
-                color = random.choice(self.color_set).rgb
-                self.image_array[i, j] = color
-
-    def get_check_position(self, x: int, y: int, direction: str) -> Tuple[int, int]:
-        """Get the position to check based on direction and handling wraparound"""
-        if direction == 'right':
-            return (x, (y + 1) % self.resolution)
-        elif direction == 'left':
-            return (x, (y - 1) % self.resolution)
-        elif direction == 'up':
-            return ((x - 1) % self.resolution, y)
-        else:  # down
-            return ((x + 1) % self.resolution, y)
+        self.labels = np.random.randint(0, self.color_depth, size=(self.resolution, self.resolution), dtype=np.uint8)
+        self._key_cache = None
+
+    @property
+    def label_bits(self) -> int:
+        """Number of bits needed to hold any color_set index"""
+        return max(1, (self.color_depth - 1).bit_length())
+
+    @property
+    def image_array(self) -> np.ndarray:
+        """RGB image of the color grid, shape (resolution, resolution, 3)
+
+        The same buffer is refilled on every access, so copy it to keep a snapshot.
+        """
+        return np.take(self.palette, self.labels, axis=0, mode='clip', out=self._rgb_out)
+
+    def labels_from_image(self, image_array: np.ndarray) -> None:
+        """Set the color grid from an RGB image array"""
+        keys = _pack_rgb(image_array)
+        order = np.argsort(self.rgb_keys)
+        pos = np.searchsorted(self.rgb_keys, keys, sorter=order).clip(0, len(order) - 1)
+        idx = order[pos]
+        if not np.array_equal(self.rgb_keys[idx], keys):
+            raise ValueError("Image contains colors outside the color set")
+        self.labels = idx.astype(np.uint8)
+        self._key_cache = None
 
     def iterate_once(self) -> None:
         """Perform one iteration of the color rules"""
-        new_array = np.copy(self.image_array)
+        self.iterate(1)
+
+    def iterate(self, count: int) -> None:
+        """Perform count iterations of the color rules"""
+        labels, spare = self.labels, self._spare_labels
+        if _step is not None:
+            padded = self._padded_labels
+            while count > 0:
+                steps = min(count, (padded.shape[0] - self.resolution) // 2)
+                _wrap_pad(labels, padded)
+                _step(padded, spare, self.dir_arr, self.activ_lut, steps)
+                labels, spare = spare, labels
+                count -= steps
+        else:
+            step = self._step_bitplanes if self.resolution % BITPLANE_WORD == 0 else self._step_numpy
+            for _ in range(count):
+                step(labels, spare)
+                labels, spare = spare, labels
         
-        for x in range(self.resolution):
-            for y in range(self.resolution):
-                current_color = tuple(self.image_array[x, y])
-                
-                # Find the color object for the current pixel
-                color_obj = next((c for c in self.color_set if c.rgb == current_color), None)
-                if color_obj:
-                    check_x, check_y = self.get_check_position(x, y, color_obj.check_direction)
-                    neighbor_color = tuple(self.image_array[check_x, check_y])
-                    
-                    if neighbor_color in color_obj.activation_colors:
-                        # Swap colors
-                        new_array[x, y] = self.image_array[check_x, check_y]
-                        new_array[check_x, check_y] = self.image_array[x, y]
+        self.labels, self._spare_labels = labels, spare
+        self._key_cache = None
+
+    def _step_numpy(self, labels: np.ndarray, new_labels: np.ndarray) -> None:
+        """Write the next color grid into new_labels with whole-grid NumPy operations"""
+        new_labels[...] = labels
+        directions = self.dir_arr[labels]
         
-        self.image_array = new_array
+        # Swaps are decided on the previous grid and applied one direction at a time,
+        # so a pixel claimed by several swaps keeps the last one written
+        for direction, (shift, axis) in enumerate(NEIGHBOR_SHIFTS):
+            neighbors = np.roll(labels, shift, axis)
+            swap = (directions == direction) & self.activ_lut[labels, neighbors]
+            new_labels[swap] = neighbors[swap]
+            
+            # The checked neighbor takes the color of the pixel that swapped with it
+            targets = np.roll(swap, -shift, axis)
+            new_labels[targets] = np.roll(labels, -shift, axis)[targets]
 
-    def get_internet_time(self) -> int:
-        """Get current internet time in minutes since epoch"""
+    def _step_bitplanes(self, labels: np.ndarray, new_labels: np.ndarray) -> None:
+        """Write the next color grid into new_labels with bitwise operations on packed bit-planes"""
+        bits = self.label_bits
+        planes = _pack_planes(labels, bits)
+        
+        # is_color[i] marks the pixels holding color i
+        is_color = []
+        for i in range(len(self.color_set)):
+            mask = ~np.zeros_like(planes[0])
+            for b in range(bits):
+                mask &= planes[b] if (i >> b) & 1 else ~planes[b]
+            is_color.append(mask)
+        
+        new_planes = planes.copy()
+        for direction, (shift, axis) in enumerate(NEIGHBOR_SHIFTS):
+            # Pixels whose color checks this direction and sees one of its activation colors
+            swap = np.zeros_like(planes[0])
+            for i in np.flatnonzero(self.dir_arr == direction):
+                activators = np.zeros_like(planes[0])
+                for j in self.activ_idx_sets[i]:
+                    activators |= is_color[j]
+                swap |= is_color[i] & _roll_words(activators, shift, axis)
+            
+            # Same write order as _step_numpy: the swapping pixel, then the checked neighbor
+            new_planes = (_roll_words(planes, shift, axis) & swap) | (new_planes & ~swap)
+            targets = _roll_words(swap, -shift, axis)
+            new_planes = (_roll_words(planes, -shift, axis) & targets) | (new_planes & ~targets)
+        
+        _unpack_planes(new_planes, new_labels)
+
+    @classmethod
+    def start_time_sync(cls) -> None:
+        """Fetch the internet time offset once per process, in a background thread"""
+        if cls._time_sync_started:
+            return
+        cls._time_sync_started = True
+        threading.Thread(target=cls._sync_internet_time, daemon=True).start()
+
+    @classmethod
+    def _sync_internet_time(cls) -> None:
+        """Measure how far internet time is from local time"""
         try:
-            response = urllib.request.urlopen('http://worldtimeapi.org/api/timezone/Etc/UTC')
+            response = urllib.request.urlopen('http://worldtimeapi.org/api/timezone/Etc/UTC', timeout=2)
             data = json.loads(response.read())
-            return int(data['unixtime'] / 60)  # Convert to minutes
-        except:
-            return int(time.time() / 60)  # Fallback to local time
+            cls._net_offset_minutes = int(data['unixtime'] / 60) - int(time.time() / 60)
+        except Exception:
+            pass  # Keep local time
+
+    def get_internet_time(self) -> int:
+        """Get current internet time in minutes since epoch"""
+        return int(time.time() / 60) + self._net_offset_minutes
 
     def update_times(self) -> None:
         """Update last and now times"""
+        self.start_time_sync()
         current_time = self.get_internet_time()
         if self.last_time == 0:
             self.last_time = current_time
@@ -121,56 +363,48 @@ class ADISFile:
         time_diff = self.now_time - self.last_time
         iterations_needed = time_diff // self.iteration_speed
         
-        for _ in range(iterations_needed):
-            self.iterate_once()
-            self.iteration_count += 1
-
-    def generate_key(self) -> str:
-        """Generate encryption key from image array"""
-        binary = ''
-        for x in range(self.resolution):
-            for y in range(self.resolution):
-                # Convert RGB values to binary representation
-                for value in self.image_array[x, y]:
-                    binary += format(value, '08b')
-        
-        # Compress consecutive bits
-        compressed = ''
-        current_bit = binary[0]
-        count = 1
+        if iterations_needed > 0:
+            self.iterate(iterations_needed)
+            self.iteration_count += iterations_needed
+
+    def generate_key(self) -> bytes:
+        """Generate encryption key from the color grid, one byte per run of equal bits
+
+        Each byte holds the bit in its high bit and the run length (1-127) below it.
+        """
+        if self._key_cache is not None:
+            return self._key_cache
         
-        for bit in binary[1:]:
-            if bit == current_bit:
-                count += 1
-            else:
-                compressed += f"{current_bit}{count}"
-                current_bit = bit
-                count = 1
+        # Binary representation of each pixel's color index, label_bits bits per pixel
+        bits = np.unpackbits(self.labels.reshape(-1, 1), axis=1)[:, -self.label_bits:].reshape(-1)
         
-        compressed += f"{current_bit}{count}"
-        return compressed
+        # Compress consecutive bits
+        syms, lengths = _run_lengths(bits, 127)
+        self._key_cache = ((syms.astype(np.uint8) << 7) | lengths.astype(np.uint8)).tobytes()
+        return self._key_cache
     
     def encrypt_string(self, text: str) -> str:
         """Encrypt string using the generated key"""
-        key = self.generate_key()
-        key_bytes = [int(key[i:i+2], 10) for i in range(0, len(key), 2)]
-        text_bytes = text.encode('utf-8')
-        encrypted_bytes = bytes(a ^ b for a, b in zip(text_bytes, key_bytes * (len(text_bytes) // len(key_bytes) + 1)))
-        return encrypted_bytes.hex()
+        key_bytes = np.frombuffer(self.generate_key(), dtype=np.uint8)
+        text_bytes = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        encrypted_bytes = np.bitwise_xor(text_bytes, np.resize(key_bytes, text_bytes.size))
+        return encrypted_bytes.tobytes().hex()
 
 
     def decrypt_string(self, encrypted_hex: str) -> str:
         """Decrypt string using the generated key"""
-        key = self.generate_key()
-        key_bytes = [int(key[i:i+2], 10) for i in range(0, len(key), 2)]
-        encrypted_bytes = bytes.fromhex(encrypted_hex)
-        decrypted_bytes = bytes(a ^ b for a, b in zip(encrypted_bytes, key_bytes * (len(encrypted_bytes) // len(key_bytes) + 1)))
-        return decrypted_bytes.decode('utf-8')
+        key_bytes = np.frombuffer(self.generate_key(), dtype=np.uint8)
+        encrypted_bytes = np.frombuffer(bytes.fromhex(encrypted_hex), dtype=np.uint8)
+        decrypted_bytes = np.bitwise_xor(encrypted_bytes, np.resize(key_bytes, encrypted_bytes.size))
+        return decrypted_bytes.tobytes().decode('utf-8')
+
+DISPLAY_SIZE = 256  # side of the canvas showing the ADIS image, in pixels
 
 class ADISEncryptionApp:
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("ADIS Encryption Program")
+        ADISFile.start_time_sync()
         self.setup_ui()
         self.canvas = None  # Canvas for displaying ADIS image
         self.adis_image_label = None  # Label for holding the ADIS image
@@ -248,12 +482,14 @@ class ADISEncryptionApp:
         # File selection
         tk.Label(existing_window, text="Select ADIS File:").pack()
         file_var = tk.StringVar()
-        files = [f for f in os.listdir() if f.endswith('.adis')]
+        # Files are only listed here; load_adis runs when one is selected
+        with os.scandir() as entries:
+            files = [e.name for e in entries if e.name.endswith('.adis') and e.is_file()]
         file_dropdown = ttk.Combobox(existing_window, textvariable=file_var, values=files)
         file_dropdown.pack()
         
         # Create a canvas to display the image
-        self.canvas = tk.Canvas(existing_window, width=256, height=256)  # Adjust dimensions as needed
+        self.canvas = tk.Canvas(existing_window, width=DISPLAY_SIZE, height=DISPLAY_SIZE)
         self.canvas.pack(pady=10)
         
         # Add button to select the ADIS file and display image
@@ -264,7 +500,7 @@ class ADISEncryptionApp:
                 return
 
             # Display the ADIS image
-            self.display_adis_image(adis_file.image_array)
+            self.display_adis_image(adis_file)
 
             ed_window = tk.Toplevel(existing_window)
             ed_window.title("Encrypt/Decrypt")
@@ -297,11 +533,13 @@ class ADISEncryptionApp:
         
         tk.Button(existing_window, text="Select", command=show_encrypt_decrypt_menu).pack(pady=10)
     
-    def display_adis_image(self, image_array: np.ndarray):
-        """Convert and display ADIS image array in the Tkinter Canvas."""
-        # Convert the image array to a PIL Image, then to ImageTk.PhotoImage for display
-        img = Image.fromarray(image_array)
-        img = img.resize((256, 256), Image.NEAREST)  # Resize for the canvas display if necessary
+    def display_adis_image(self, adis: ADISFile):
+        """Convert and display the ADIS image in the Tkinter Canvas."""
+        # Nearest-neighbor sample the color grid down (or up) to the canvas size,
+        # so only the displayed pixels are expanded to RGB
+        idx = (2 * np.arange(DISPLAY_SIZE) + 1) * adis.resolution // (2 * DISPLAY_SIZE)  # pixel centers
+        view = adis.labels[idx[:, None], idx[None, :]]
+        img = Image.fromarray(adis.palette[view])
         photo_img = ImageTk.PhotoImage(img)
         
         # Clear the canvas and display the new image
@@ -310,7 +548,7 @@ class ADISEncryptionApp:
         self.canvas.image = photo_img  # Keep a reference to avoid garbage collection
     
     def save_adis(self, adis: ADISFile, filename: str) -> None:
-        """Save ADIS file to disk"""
+        """Save ADIS file to disk, with the image arrays in a compressed <filename>.npz beside it"""
         data = {
             'resolution': adis.resolution,
             'color_depth': adis.color_depth,
@@ -318,14 +556,16 @@ class ADISEncryptionApp:
             'last_time': adis.last_time,
             'now_time': adis.now_time,
             'iteration_count': adis.iteration_count,
-            'image_array': adis.image_array.tolist(),
             'encrypted_string': adis.encrypted_string,
-            'key_image': adis.key_image.tolist() if adis.key_image is not None else None,
             'color_set': [(c.rgb, c.check_direction, c.activation_colors) for c in adis.color_set]
         }
         
         with open(filename, 'w') as f:
             json.dump(data, f)
+        
+        np.savez_compressed(f"{filename}.npz",
+                            image_array=adis.image_array,
+                            key_image=adis.key_image if adis.key_image is not None else np.empty(0, dtype=np.uint8))
     
     def load_adis(self, filename: str) -> Optional[ADISFile]:
         """Load ADIS file from disk"""
@@ -342,12 +582,15 @@ class ADISEncryptionApp:
                 iteration_count=data['iteration_count']
             )
             
-            adis.image_array = np.array(data['image_array'], dtype=np.uint8)
+            with np.load(f"{filename}.npz") as arrays:
+                image_array = arrays['image_array']
+                adis.key_image = arrays['key_image'] if arrays['key_image'].size else None
             adis.encrypted_string = data['encrypted_string']
-            adis.key_image = np.array(data['key_image'], dtype=np.uint8) if data['key_image'] else None
             
             for rgb, direction, activation_colors in data['color_set']:
                 adis.color_set.append(Color(tuple(rgb), direction, [tuple(c) for c in activation_colors]))
+            adis.build_color_tables()
+            adis.labels_from_image(image_array)
             
             return adis
         except Exception as e: